@@ -6,12 +6,17 @@ Fills incomplete workdays in Toggl Track based on your past activity.
 
 import os
 import json
+import time
 import random
+import glob
+import hashlib
+import functools
 import calendar
 import datetime
-import requests
 import base64
-import yaml
+import threading
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
 from zoneinfo import ZoneInfo
 
 # ─── Optional: load from .env file ────────────────────────────────────────────
@@ -21,10 +26,29 @@ try:
 except ImportError:
     pass
 
+# ─── Optional: faster JSON via orjson (falls back to stdlib json) ─────────────
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def json_loads(data):
+    """Parse JSON from bytes or str."""
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+def json_dumps(obj, indent=False):
+    """Serialize obj to UTF-8 JSON bytes."""
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+    return json.dumps(obj, indent=2 if indent else None).encode()
+
 # ──── Load config.yaml ────────────────────────────────────────────────────────
 def _load_config():
     try:
         with open(os.path.join(os.path.dirname(__file__), "config.yaml")) as f:
+            import yaml  # only needed here — keep it off the import path otherwise
             return yaml.safe_load(f) or {}
     except FileNotFoundError:
         return {}
@@ -58,10 +82,15 @@ if _dp_env is not None:
     DEFAULT_PROJECTS = [p.strip() for p in _dp_env.split(",") if p.strip()]
 else:
     DEFAULT_PROJECTS = _cfg.get("default_projects", [])
+DEFAULT_PROJECTS_SET = frozenset(DEFAULT_PROJECTS)
 # ══════════════════════════════════════════════════════════════════════════════
 
 TZ = ZoneInfo(TIMEZONE)
 TOGGL_BASE = "https://api.track.toggl.com/api/v9"
+_AUTH_HEADERS = {
+    "Authorization": "Basic " + base64.b64encode(f"{TOGGL_API_TOKEN}:api_token".encode()).decode(),
+    "Content-Type": "application/json",
+}
 
 _h, _m = DAY_START_TIME.split(":")
 DAY_START = datetime.time(int(_h), int(_m))
@@ -69,46 +98,212 @@ DAY_START = datetime.time(int(_h), int(_m))
 
 # ─── Toggl helpers ─────────────────────────────────────────────────────────────
 
-def toggl_auth_header():
-    token = f"{TOGGL_API_TOKEN}:api_token"
-    encoded = base64.b64encode(token.encode()).decode()
-    return {"Authorization": f"Basic {encoded}", "Content-Type": "application/json"}
+# One pooled session for every Toggl call: keeps TCP/TLS connections alive
+# between requests and retries transient failures (rate limit, gateway errors).
+# Built on first use so `requests` is not imported until the first API call.
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+
+
+def _session():
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                from urllib3.util.retry import Retry
+                session = requests.Session()
+                session.headers.update(_AUTH_HEADERS)
+                session.mount("https://", HTTPAdapter(
+                    pool_connections=4,
+                    pool_maxsize=8,
+                    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 502, 503, 504],
+                                      raise_on_status=False),
+                ))
+                _SESSION = session
+    return _SESSION
+
+
+# Identical GETs already in flight (e.g. two threads missing the projects
+# cache at once) wait on the first request instead of issuing their own.
+_INFLIGHT = {}
+_INFLIGHT_LOCK = threading.Lock()
 
 
 def toggl_get(path, params=None):
-    r = requests.get(f"{TOGGL_BASE}{path}", headers=toggl_auth_header(), params=params)
-    r.raise_for_status()
-    return r.json()
+    key = (path, frozenset((params or {}).items()))
+    with _INFLIGHT_LOCK:
+        future = _INFLIGHT.get(key)
+        leader = future is None
+        if leader:
+            future = _INFLIGHT[key] = Future()
+    if not leader:
+        return future.result()
+    try:
+        r = _session().get(f"{TOGGL_BASE}{path}", params=params)
+        r.raise_for_status()
+        result = json_loads(r.content)
+    except BaseException as ex:  # waiters must never be left blocked, even on Ctrl-C
+        future.set_exception(ex)
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        with _INFLIGHT_LOCK:
+            del _INFLIGHT[key]
+
+
+MAX_RETRY_WAIT_SECS = 10  # longer Retry-After (e.g. hourly quota) fails the entry instead of blocking
+
+
+def _retry_after_secs(r, attempt):
+    """Seconds to wait before resending a rate-limited request: Retry-After, else backoff."""
+    try:
+        return max(float(r.headers.get("Retry-After", "")), 0)
+    except ValueError:
+        return 0.3 * 2 ** attempt
+
+
+def toggl_post(path, data, max_retries=3):
+    payload = json_dumps(data)
+    for attempt in range(max_retries + 1):
+        r = _session().post(f"{TOGGL_BASE}{path}", data=payload)  # Content-Type set on the session
+        # 429 means nothing was created, so resending is safe; 5xx is never retried (could duplicate)
+        if r.status_code != 429 or attempt == max_retries:
+            break
+        wait = _retry_after_secs(r, attempt)
+        if wait > MAX_RETRY_WAIT_SECS:
+            break  # reported as a 429 failure below
+        time.sleep(wait)
+    body = r.content
+    if r.status_code >= 400:
+        import requests
+        raise requests.HTTPError(f"{r.status_code} {r.reason}: {body.decode('utf-8', 'replace')}", response=r)
+    return json_loads(body)
 
 
-def toggl_post(path, data):
-    r = requests.post(f"{TOGGL_BASE}{path}", headers=toggl_auth_header(), json=data)
-    if not r.ok:
-        raise requests.HTTPError(f"{r.status_code} {r.reason}: {r.text}", response=r)
-    return r.json()
+# ─── Response cache ────────────────────────────────────────────────────────────
+# Slow-changing lookups are cached on disk between runs. Set TOGGL_NO_CACHE=1
+# to bypass the cache (always hit the API).
 
+CACHE_DIR = os.path.join(os.getenv("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "toggl-sync")
+NO_CACHE  = os.getenv("TOGGL_NO_CACHE", "").lower() in ("1", "true", "yes")
 
+CACHE_TTL_ME         = 7 * 24 * 3600   # /me (default workspace)
+CACHE_TTL_PROJECTS   = 24 * 3600       # /workspaces/{wid}/projects
+CACHE_TTL_ACTIVITIES = 10 * 60         # past-activities lookup
+
+
+def ttl_cache(ttl_seconds, name):
+    """
+    Cache a toggl_get-style (path, params) call as JSON on disk for ttl_seconds.
+    Files are prefixed with name; the wrapper's cache_clear() deletes them.
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(path, params=None):
+            if NO_CACHE:
+                return fn(path, params)
+            raw_key = json.dumps([TOGGL_API_TOKEN, path, sorted((params or {}).items())])
+            key = hashlib.blake2b(raw_key.encode(), digest_size=16).hexdigest()
+            cache_file = os.path.join(CACHE_DIR, f"{name}-{key}.json")
+            try:
+                with open(cache_file, "rb") as f:
+                    cached = json_loads(f.read())
+                if time.time() - cached["fetched_at"] < ttl_seconds:
+                    return cached["payload"]
+            except (OSError, ValueError, KeyError):
+                pass  # missing, unreadable or stale-format entry — refetch
+            payload = fn(path, params)
+            try:
+                # Payloads include task descriptions — keep them private to the user
+                os.makedirs(CACHE_DIR, mode=0o700, exist_ok=True)
+                fd = os.open(cache_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+                os.chmod(cache_file, 0o600)  # mode above only applies to newly created files
+                with os.fdopen(fd, "wb") as f:
+                    f.write(json_dumps({"fetched_at": time.time(), "payload": payload}))
+            except OSError:
+                pass  # caching is best-effort
+            return payload
+
+        def cache_clear():
+            for cache_file in glob.glob(os.path.join(CACHE_DIR, f"{name}-*.json")):
+                try:
+                    os.remove(cache_file)
+                except OSError:
+                    pass
+
+        wrapper.cache_clear = cache_clear
+        return wrapper
+    return decorator
+
+
+toggl_get_me         = ttl_cache(CACHE_TTL_ME, "me")(toggl_get)
+toggl_get_projects   = ttl_cache(CACHE_TTL_PROJECTS, "projects")(toggl_get)
+toggl_get_activities = ttl_cache(CACHE_TTL_ACTIVITIES, "activities")(toggl_get)
+
+
+@functools.lru_cache(maxsize=1)
 def get_workspace_id():
     global TOGGL_WORKSPACE_ID
     if TOGGL_WORKSPACE_ID:
         return int(TOGGL_WORKSPACE_ID)
-    me = toggl_get("/me")
+    me = toggl_get_me("/me")
     TOGGL_WORKSPACE_ID = me["default_workspace_id"]
     return TOGGL_WORKSPACE_ID
 
 
+@functools.lru_cache(maxsize=1)
 def get_projects():
     wid = get_workspace_id()
-    projects = toggl_get(f"/workspaces/{wid}/projects")
+    projects = toggl_get_projects(f"/workspaces/{wid}/projects")
     return {p["name"]: p["id"] for p in (projects or [])}
 
 
+# {(start_date, end_date): entries} for the current menu action (main() clears it
+# per action). Any cached range that covers a requested one is filtered locally
+# instead of refetched; writes clear it too.
+# Only live toggl_get results go in — disk-cached payloads may predate a write.
+_RANGE_CACHE = {}
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_local(iso):
+    """Parse a Toggl ISO timestamp into local (TZ) time. Raises ValueError if malformed."""
+    return datetime.datetime.fromisoformat(iso).astimezone(TZ)
+
+
+def _parse_local_date(iso):
+    """Local (TZ) calendar date of a Toggl ISO timestamp, or None if unparsable."""
+    try:
+        return _parse_local(iso).date()
+    except ValueError:
+        return None
+
+
+def get_entries_range(start_date: datetime.date, end_date: datetime.date, fetch=toggl_get):
+    """Return time entries starting between start_date and end_date (inclusive, local time)."""
+    for (cached_start, cached_end), entries in list(_RANGE_CACHE.items()):
+        if cached_start <= start_date and end_date <= cached_end:
+            if (cached_start, cached_end) == (start_date, end_date):
+                return entries
+            return [
+                e for e in entries
+                if (d := _parse_local_date(e.get("start", ""))) and start_date <= d <= end_date
+            ]
+    start = datetime.datetime(start_date.year, start_date.month, start_date.day, tzinfo=TZ).isoformat()
+    end   = datetime.datetime(end_date.year, end_date.month, end_date.day, 23, 59, 59, tzinfo=TZ).isoformat()
+    entries = fetch("/me/time_entries", params={"start_date": start, "end_date": end}) or []
+    if fetch is toggl_get:
+        _RANGE_CACHE[(start_date, end_date)] = entries
+    return entries
+
+
 def get_existing_entries(date: datetime.date):
     """Return time entries already logged for a given date."""
-    start = datetime.datetime(date.year, date.month, date.day, tzinfo=TZ).isoformat()
-    end   = datetime.datetime(date.year, date.month, date.day, 23, 59, 59, tzinfo=TZ).isoformat()
-    entries = toggl_get("/me/time_entries", params={"start_date": start, "end_date": end})
-    return entries or []
+    return get_entries_range(date, date)
 
 
 def create_time_entry(description, project_id, start: datetime.datetime, duration_seconds: int, billable=True):
@@ -123,42 +318,88 @@ def create_time_entry(description, project_id, start: datetime.datetime, duratio
     }
     if project_id:
         data["project_id"] = project_id
+    _RANGE_CACHE.clear()
+    toggl_get_activities.cache_clear()
     return toggl_post(f"/workspaces/{wid}/time_entries", data)
 
 
+def create_time_entries(entries, max_workers=5):
+    """
+    Create several time entries (dicts with description, project_id, start,
+    duration, billable). Returns one result per entry, in order: the created
+    entry, or the exception raised for it.
+    """
+    def create(e):
+        try:
+            return create_time_entry(e["description"], e.get("project_id"), e["start"], e["duration"],
+                                     billable=e.get("billable", True))
+        except Exception as ex:
+            return ex
+
+    if not entries:
+        return []
+    # Toggl v9 has no bulk-create endpoint; POST in parallel, bounded to stay under the rate limit
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(entries))) as pool:
+        return list(pool.map(create, entries))
+
+
+def fetch_concurrently(*calls, max_workers=10):
+    """Run independent zero-arg Toggl fetches in parallel; returns results in call order."""
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(calls))) as pool:
+        futures = [pool.submit(call) for call in calls]
+        return [f.result() for f in futures]
+
+
 # ─── Month analysis ────────────────────────────────────────────────────────────
 
 def get_month_entries(year, month):
     """Fetch all time entries for the given month in a single API call."""
     first_day = datetime.date(year, month, 1)
     last_day  = datetime.date(year, month, calendar.monthrange(year, month)[1])
-    start = datetime.datetime(first_day.year, first_day.month, first_day.day, tzinfo=TZ).isoformat()
-    end   = datetime.datetime(last_day.year, last_day.month, last_day.day, 23, 59, 59, tzinfo=TZ).isoformat()
-    entries = toggl_get("/me/time_entries", params={"start_date": start, "end_date": end})
-    return entries or []
+    return get_entries_range(first_day, last_day)
+
+
+def _is_break(entry):
+    """True for a logged 'Break' entry (case- and whitespace-insensitive)."""
+    return (entry.get("description") or "").strip().lower() == "break"
 
 
-def analyze_month(entries, year, month):
-    """Group entries by date, sum duration per day. Returns {date: total_seconds}."""
-    totals = {}
+def working_days_in_month(year, month):
+    """Mon–Fri dates of the month, derived from the month's first weekday."""
+    first_weekday, num_days = calendar.monthrange(year, month)
+    return [
+        datetime.date(year, month, d)
+        for d in range(1, num_days + 1)
+        if (first_weekday + d - 1) % 7 < 5  # Mon–Fri
+    ]
+
+
+def analyze_month(entries):
+    """
+    Group entries by local date in one pass. Returns (totals, billable, by_day_entries):
+    totals / billable map date → logged / billable seconds (excluding breaks
+    and running timers), by_day_entries maps date → every entry starting that day.
+    """
+    totals = defaultdict(int)
+    billable = defaultdict(int)
+    by_day_entries = defaultdict(list)
     for e in entries:
-        dur = e.get("duration", 0)
-        if dur < 0:  # running timer — skip
-            continue
-        desc = (e.get("description") or "").lower()
-        if desc == "break":
-            continue
         start_str = e.get("start", "")
         if not start_str:
             continue
-        try:
-            dt = datetime.datetime.fromisoformat(start_str).astimezone(TZ)
-        except ValueError:
+        d = _parse_local_date(start_str)
+        if d is None:
+            continue
+        by_day_entries[d].append(e)
+        dur = e.get("duration", 0)
+        if dur < 0:  # running timer — not counted
             continue
-        d = dt.date()
-        if d.year == year and d.month == month:
-            totals[d] = totals.get(d, 0) + dur
-    return totals
+        if _is_break(e):
+            continue
+        totals[d] += dur
+        if e.get("billable", False):
+            billable[d] += dur
+    return dict(totals), dict(billable), dict(by_day_entries)
 
 
 # ─── Past activities from Toggl ────────────────────────────────────────────────
@@ -167,18 +408,16 @@ def get_past_activities(days=14):
     """Fetch unique task descriptions from the past N days, most recent first."""
     today = datetime.date.today()
     start_date = today - datetime.timedelta(days=days)
-    start = datetime.datetime(start_date.year, start_date.month, start_date.day, tzinfo=TZ).isoformat()
-    end   = datetime.datetime(today.year, today.month, today.day, 23, 59, 59, tzinfo=TZ).isoformat()
-    entries = toggl_get("/me/time_entries", params={"start_date": start, "end_date": end})
-    entries = sorted(entries or [], key=lambda e: e.get("start", ""), reverse=True)
-    seen = set()
-    activities = []
-    for e in entries:
-        desc = (e.get("description") or "").strip()
-        if desc and desc.lower() not in ("break", "daily") and desc not in seen:
-            seen.add(desc)
-            activities.append(desc)
-    return activities
+    # Served from the month fetch when it already spans the window (mid-month onward)
+    entries = get_entries_range(start_date, today, fetch=toggl_get_activities)
+    # Drop breaks/standups before sorting, then dedupe keeping the most recent occurrence first
+    recent = sorted(
+        ((e.get("start", ""), desc) for e in entries
+         if (desc := (e.get("description") or "").strip()) and not _is_break(e) and desc.lower() != "daily"),
+        key=lambda pair: pair[0],
+        reverse=True,
+    )
+    return list(dict.fromkeys(desc for _, desc in recent))
 
 
 # ─── Break insertion ───────────────────────────────────────────────────────────
@@ -196,21 +435,20 @@ def insert_breaks(entries, break_secs=900):
         dur = entry["duration"]
         if dur <= MIN_BREAK_THRESHOLD:
             result.append(entry)
-        else:
-            remaining = dur
-            while remaining > 0:
-                # Random continuous block: 2h–3h in 15-min steps
-                steps = random.randint(8, 12)  # 8×15min=2h … 12×15min=3h
-                max_chunk = steps * 900
-                chunk = min(remaining, max_chunk)
-                e = dict(entry)
-                e["duration"] = chunk
-                result.append(e)
-                remaining -= chunk
-                if remaining > 0:
-                    result.append({"description": "Break", "duration": break_secs,
-                                   "project_id": None, "billable": False, "_is_break": True})
-                    # breaks are NOT subtracted from remaining work
+            continue
+        # Random continuous blocks: 2h–3h in 15-min steps (8×15min=2h … 12×15min=3h).
+        # Every block but the last is ≥2h, so ceil(dur / 2h) draws always suffice.
+        steps = random.choices(range(8, 13), k=-(-dur // MIN_BREAK_THRESHOLD))
+        remaining = dur
+        for step in steps:
+            chunk = min(remaining, step * 900)
+            result.append(entry | {"duration": chunk})
+            remaining -= chunk
+            if remaining == 0:
+                break
+            result.append({"description": "Break", "duration": break_secs,
+                           "project_id": None, "billable": False, "_is_break": True})
+            # breaks are NOT subtracted from remaining work
     return result
 
 
@@ -225,7 +463,7 @@ def _get_existing_intervals(existing_entries):
         if dur < 0:
             continue
         try:
-            st = datetime.datetime.fromisoformat(start_str).astimezone(TZ)
+            st = _parse_local(start_str)
         except ValueError:
             continue
         end_t = st + datetime.timedelta(seconds=max(dur, 0))
@@ -323,6 +561,7 @@ def schedule_entries_into_slots(entries, slots, break_gap_secs=MIN_GAP_MINS * 60
 
 # ─── Helpers ───────────────────────────────────────────────────────────────────
 
+@functools.lru_cache(maxsize=4096)
 def fmt_duration(secs):
     h = secs // 3600
     m = (secs % 3600) // 60
@@ -334,6 +573,14 @@ def fmt_duration(secs):
         return f"{m}m"
 
 
+_DAY_ABBR = tuple(calendar.day_abbr)  # Mon … Sun, same text as strftime("%a")
+
+
+def day_label(d):
+    """Overview row label, e.g. 'Mon 05' — a table lookup instead of strftime per row."""
+    return f"{_DAY_ABBR[d.weekday()]} {d.day:02d}"
+
+
 def parse_hours(val):
     """Accept '1:30' (H:mm) or '1.5' (decimal). Returns float hours."""
     if ":" in val:
@@ -342,21 +589,20 @@ def parse_hours(val):
     return float(val)
 
 
-def pick_project(projects, task_name):
-    """Let user pick a Toggl project for a task. Auto-selects if DEFAULT_PROJECTS yields one match."""
-    if not projects:
+def project_choices(projects):
+    """(name, id) pairs offered by pick_project: DEFAULT_PROJECTS matches, else all projects."""
+    choices = tuple(item for item in projects.items() if item[0] in DEFAULT_PROJECTS_SET)
+    return choices or tuple(projects.items())  # fallback to all if none match
+
+
+def pick_project(choices, task_name):
+    """Let user pick a Toggl project for a task from project_choices(). Auto-selects a single choice."""
+    if not choices:
         return None
-    if DEFAULT_PROJECTS:
-        filtered = {k: v for k, v in projects.items() if k in DEFAULT_PROJECTS}
-        if not filtered:
-            filtered = projects  # fallback to all if none match
-    else:
-        filtered = projects
-    proj_list = list(filtered.items())
-    if len(proj_list) == 1:
-        return proj_list[0][1]  # auto-select, no prompt
+    if len(choices) == 1:
+        return choices[0][1]  # auto-select, no prompt
     print(f"\n  Project for '{task_name}':")
-    for i, (name, _) in enumerate(proj_list):
+    for i, (name, _) in enumerate(choices):
         print(f"    [{i+1}] {name}")
     print(f"    [0] No project")
     choice = input("  Choice: ").strip()
@@ -364,7 +610,7 @@ def pick_project(projects, task_name):
         idx = int(choice)
         if idx == 0:
             return None
-        return proj_list[idx - 1][1]
+        return choices[idx - 1][1]
     except (ValueError, IndexError):
         return None
 
@@ -375,13 +621,13 @@ STATE_FILE = ".toggl_state.json"
 
 def load_state():
     if os.path.exists(STATE_FILE):
-        with open(STATE_FILE) as f:
-            return json.load(f)
+        with open(STATE_FILE, "rb") as f:
+            return json_loads(f.read())
     return {}
 
 def save_state(state):
-    with open(STATE_FILE, "w") as f:
-        json.dump(state, f, indent=2)
+    with open(STATE_FILE, "wb") as f:
+        f.write(json_dumps(state, indent=True))
 
 
 # ─── Interactive day filler ────────────────────────────────────────────────────
@@ -392,7 +638,7 @@ def fill_day(date: datetime.date, existing_entries, activities, projects):
     already_logged = sum(
         max(e.get("duration", 0), 0)
         for e in existing_entries
-        if (e.get("description") or "").lower() != "break"
+        if not _is_break(e)
     )
     remaining_secs = workday_secs - already_logged
     if remaining_secs <= 0:
@@ -400,6 +646,7 @@ def fill_day(date: datetime.date, existing_entries, activities, projects):
 
     min_gap_secs = MIN_GAP_MINS * 60
     fill_slots = build_fill_slots(date, existing_entries, min_gap_secs)
+    choices = project_choices(projects)
 
     print(f"\n  ── {date.strftime('%A %d %b')} — {fmt_duration(remaining_secs)} to fill ──")
     new_entries = []
@@ -413,7 +660,7 @@ def fill_day(date: datetime.date, existing_entries, activities, projects):
         )
         if not daily_already and rem > 0:
             daily_secs = DAILY_STANDUP_MINS * 60
-            daily_proj = pick_project(projects, "Daily")
+            daily_proj = pick_project(choices, "Daily")
             new_entries.append({"description": "Daily", "duration": daily_secs,
                                 "project_id": daily_proj, "billable": BILLABLE})
             rem -= daily_secs
@@ -424,7 +671,7 @@ def fill_day(date: datetime.date, existing_entries, activities, projects):
         prompt = f"  '{activity}' — hours or H:mm (Enter=fill {fmt_duration(rem)} remaining, 0=skip): "
         val = input(prompt).strip()
         if val == "":
-            proj_id = pick_project(projects, activity)
+            proj_id = pick_project(choices, activity)
             new_entries.append({"description": activity, "duration": rem, "project_id": proj_id, "billable": BILLABLE})
             rem = 0
             break
@@ -437,7 +684,7 @@ def fill_day(date: datetime.date, existing_entries, activities, projects):
                 print("  Invalid input, skipping.")
                 continue
             secs = min(int(hours * 3600), rem)
-            proj_id = pick_project(projects, activity)
+            proj_id = pick_project(choices, activity)
             new_entries.append({"description": activity, "duration": secs, "project_id": proj_id, "billable": BILLABLE})
             rem -= secs
 
@@ -448,7 +695,7 @@ def fill_day(date: datetime.date, existing_entries, activities, projects):
             "Add a custom task (or press Enter to skip day): "
         ).strip()
         if val:
-            proj_id = pick_project(projects, val)
+            proj_id = pick_project(choices, val)
             new_entries.append({"description": val, "duration": rem, "project_id": proj_id, "billable": BILLABLE})
             rem = 0
 
@@ -478,7 +725,7 @@ def fill_day(date: datetime.date, existing_entries, activities, projects):
         if dur < 0 or not start_str:
             continue
         try:
-            st = datetime.datetime.fromisoformat(start_str).astimezone(TZ)
+            st = _parse_local(start_str)
         except ValueError:
             continue
         desc = e.get("description") or "(no description)"
@@ -502,22 +749,13 @@ def fill_day(date: datetime.date, existing_entries, activities, projects):
         print("  Cancelled.")
         return
 
+    work_entries = [e for e in schedule if not e.get("_is_break")]  # breaks are gaps only — not pushed
     success = 0
-    work_entries = [e for e in schedule if not e.get("_is_break")]
-    for entry in schedule:
-        if entry.get("_is_break"):
-            continue   # gap only — not pushed to Toggl
-        try:
-            create_time_entry(
-                entry["description"],
-                entry.get("project_id"),
-                entry["start"],
-                entry["duration"],
-                billable=entry.get("billable", True),
-            )
+    for entry, result in zip(work_entries, create_time_entries(work_entries)):
+        if isinstance(result, Exception):
+            print(f"  ✗ Failed '{entry['description']}': {result}")
+        else:
             success += 1
-        except Exception as ex:
-            print(f"  ✗ Failed '{entry['description']}': {ex}")
 
     print(f"  Created {success}/{len(work_entries)} entries.")
 
@@ -531,19 +769,18 @@ def run_month_fill():
 
     print(f"\n━━ {month_name} ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
     print("  Fetching month entries from Toggl...")
-    all_entries = get_month_entries(year, month)
-    day_totals  = analyze_month(all_entries, year, month)
+    # Resolve workspace + projects while the month payload downloads
+    all_entries, projects = fetch_concurrently(
+        lambda: get_month_entries(year, month),
+        get_projects,
+    )
+    day_totals, _, by_day_entries = analyze_month(all_entries)
 
     workday_secs = WORKDAY_HOURS * 3600
     now = datetime.datetime.now(TZ)
 
     # Collect working days up to and including today
-    num_days = calendar.monthrange(year, month)[1]
-    working_days = [
-        datetime.date(year, month, d)
-        for d in range(1, num_days + 1)
-        if datetime.date(year, month, d).weekday() < 5  # Mon–Fri
-    ]
+    working_days = working_days_in_month(year, month)
 
     # Print overview
     over_count = 0
@@ -552,7 +789,7 @@ def run_month_fill():
         if d > today:
             break
         total = day_totals.get(d, 0)
-        label = d.strftime("%a %d")
+        label = day_label(d)
         if d == today and now.hour < 18:
             print(f"  {label}  ─  (today, skipping — not yet 6 PM)")
             continue
@@ -575,10 +812,9 @@ def run_month_fill():
         print("\n  All days complete!")
         return
 
-    # Fetch activities and projects once for the whole session
+    # Fetch activities once for the whole session (projects were fetched above)
     print("\n  Fetching recent activities from Toggl...")
     activities = get_past_activities(days=14)
-    projects   = get_projects()
 
     if not activities:
         print("  No past activities found. You'll be prompted for custom tasks.")
@@ -589,16 +825,7 @@ def run_month_fill():
             break
         if d == today and now.hour < 18:
             continue
-        existing = []
-        for e in all_entries:
-            start_str = e.get("start", "")
-            try:
-                dt = datetime.datetime.fromisoformat(start_str).astimezone(TZ)
-                if dt.date() == d:
-                    existing.append(e)
-            except ValueError:
-                pass
-        fill_day(d, existing, activities, projects)
+        fill_day(d, by_day_entries.get(d, []), activities, projects)
 
     print("\n  Month fill complete.")
 
@@ -614,9 +841,11 @@ def menu_sync_date():
         print("  Invalid date.")
         return
 
-    existing   = get_existing_entries(date)
-    activities = get_past_activities()
-    projects   = get_projects()
+    existing, activities, projects = fetch_concurrently(
+        lambda: get_existing_entries(date),
+        get_past_activities,
+        get_projects,
+    )
     fill_day(date, existing, activities, projects)
 
 
@@ -627,7 +856,7 @@ def menu_task_hours():
         print("  No past activities found in Toggl.")
         return
 
-    projects = get_projects()
+    choices = project_choices(get_projects())
     date_str = input("  Which date to log for? (YYYY-MM-DD, blank = today): ").strip()
     if date_str:
         try:
@@ -650,7 +879,7 @@ def menu_task_hours():
             continue
         if hours <= 0:
             continue
-        proj_id = pick_project(projects, task)
+        proj_id = pick_project(choices, task)
         secs = int(hours * 3600)
         entries.append({"description": task, "start": cursor, "duration": secs, "project_id": proj_id, "billable": BILLABLE})
         cursor += datetime.timedelta(seconds=secs)
@@ -665,12 +894,11 @@ def menu_task_hours():
     if confirm != "y":
         return
 
-    for e in entries:
-        try:
-            create_time_entry(e["description"], e["project_id"], e["start"], e["duration"], billable=e.get("billable", True))
+    for e, result in zip(entries, create_time_entries(entries)):
+        if isinstance(result, Exception):
+            print(f"  ✗ {result}")
+        else:
             print(f"  ✓ '{e['description']}' logged.")
-        except Exception as ex:
-            print(f"  ✗ {ex}")
 
 
 def menu_day_off():
@@ -748,48 +976,19 @@ def menu_monthly_report():
 
     print(f"\n━━ Monthly Report: {datetime.date(year, month, 1).strftime('%B %Y')} ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
 
-    entries = get_month_entries(year, month) or []
-
-    # Group by date
-    by_day = {}
-    for e in entries:
-        dur = e.get("duration", 0)
-        if dur < 0:
-            continue
-        desc = (e.get("description") or "").strip().lower()
-        if desc == "break":
-            continue
-        start_str = e.get("start", "")
-        if not start_str:
-            continue
-        try:
-            dt = datetime.datetime.fromisoformat(start_str).astimezone(TZ)
-        except ValueError:
-            continue
-        day = dt.date()
-        if day not in by_day:
-            by_day[day] = {"total": 0, "billable": 0}
-        by_day[day]["total"] += dur
-        if e.get("billable", False):
-            by_day[day]["billable"] += dur
-
-    num_days = calendar.monthrange(year, month)[1]
-    working_days = [
-        datetime.date(year, month, d)
-        for d in range(1, num_days + 1)
-        if datetime.date(year, month, d).weekday() < 5
-    ]
+    entries = get_month_entries(year, month)
+    day_totals, day_billable, _ = analyze_month(entries)
 
+    working_days = working_days_in_month(year, month)
     target_secs = int(WORKDAY_HOURS * 3600)
     grand_total = grand_billable = 0
 
     for day in working_days:
-        data = by_day.get(day, {"total": 0, "billable": 0})
-        total_s = data["total"]
-        bill_s = data["billable"]
+        total_s = day_totals.get(day, 0)
+        bill_s = day_billable.get(day, 0)
         grand_total += total_s
         grand_billable += bill_s
-        label = day.strftime("%a %d")
+        label = day_label(day)
         if total_s == 0:
             status = "—"
         elif total_s >= target_secs:
@@ -835,6 +1034,7 @@ def main():
   [q] Quit
 """)
         choice = input("  Choose: ").strip().lower()
+        _RANGE_CACHE.clear()  # reuse fetched entries within one action only — Toggl may change in between
         if choice == "1":
             run_month_fill()
         elif choice == "2":